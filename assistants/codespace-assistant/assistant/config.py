@@ -1,5 +1,5 @@
 from textwrap import dedent
-from typing import Annotated
+from typing import Annotated, Any, ClassVar
 
 from assistant_extensions.ai_clients.config import AzureOpenAIClientConfigModel, OpenAIClientConfigModel
 from assistant_extensions.attachments import AttachmentsConfigModel
@@ -111,7 +111,20 @@ class ResponseBehaviorConfigModel(BaseModel):
     ] = False
 
 
-class HostedMCPServersConfigModel(BaseModel):
+class _HostedMCPServersBaseModel(BaseModel):
+    # names of the fields that are of type HostedMCPServerConfig, computed for each subclass as it is defined
+    # (pydantic only calls this hook for subclasses, so it lives on a base of HostedMCPServersConfigModel)
+    hosted_field_names: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.hosted_field_names = tuple(
+            name for name, field in cls.model_fields.items() if field.annotation is HostedMCPServerConfig
+        )
+
+
+class HostedMCPServersConfigModel(_HostedMCPServersBaseModel):
     web_research: Annotated[
         HostedMCPServerConfig,
         Field(
@@ -205,14 +218,20 @@ class HostedMCPServersConfigModel(BaseModel):
         """
         Returns a list of all hosted MCP servers that are configured.
         """
-        # Get all fields that are of type HostedMCPServerConfig
-        configs = [
-            getattr(self, field)
-            for field in self.model_fields
-            if isinstance(getattr(self, field), HostedMCPServerConfig)
-        ]
         # Filter out any configs that are missing command (URL)
-        return [config for config in configs if config.command]
+        return [config for field in self.hosted_field_names if (config := getattr(self, field)).command]
+
+
+_ADDITIONAL_TOOLS_INSTRUCTIONS = dedent("""
+    - Use the available tools to assist with specific tasks.
+    - Before performing any file operations, use the `list_allowed_directories` tool to get a list of directories
+        that are allowed for file operations. Always use paths relative to an allowed directory.
+    - When searching or browsing for files, consider the kinds of folders and files that should be avoided:
+        - For example, for coding projects exclude folders like `.git`, `.vscode`, `node_modules`, and `dist`.
+    - For each turn, always re-read a file before using it to ensure the most up-to-date information, especially
+        when writing or editing files.
+    - The search tool does not appear to support wildcards, but does work with partial file names.
+""").strip()
 
 
 class AdvancedToolConfigModel(BaseModel):
@@ -244,16 +263,7 @@ class AdvancedToolConfigModel(BaseModel):
             """).strip(),
         ),
         UISchema(widget="textarea", enable_markdown_in_description=True),
-    ] = dedent("""
-        - Use the available tools to assist with specific tasks.
-        - Before performing any file operations, use the `list_allowed_directories` tool to get a list of directories
-            that are allowed for file operations. Always use paths relative to an allowed directory.
-        - When searching or browsing for files, consider the kinds of folders and files that should be avoided:
-            - For example, for coding projects exclude folders like `.git`, `.vscode`, `node_modules`, and `dist`.
-        - For each turn, always re-read a file before using it to ensure the most up-to-date information, especially
-            when writing or editing files.
-        - The search tool does not appear to support wildcards, but does work with partial file names.
-    """).strip()
+    ] = _ADDITIONAL_TOOLS_INSTRUCTIONS
 
     tools_disabled: Annotated[
         list[str],
@@ -267,6 +277,55 @@ class AdvancedToolConfigModel(BaseModel):
     ] = ["directory_tree"]
 
 
+_FUSION_PROMPT = dedent("""
+    When creating models using the Fusion tool suite, keep these guidelines in mind:
+
+    - **Coordinate System & Planes:**
+    - **Axes:** Z is vertical, X is horizontal, and Y is depth.
+    - **Primary Planes:**
+        - **XY:** Represents top and bottom surfaces (use the top or bottom Z coordinate as needed).
+        - **XZ:** Represents the front and back surfaces (use the appropriate Y coordinate).
+        - **YZ:** Represents the left and right surfaces (use the appropriate X coordinate).
+
+    - **Sketch & Geometry Management:**
+    - **Sketch Creation:** Always create or select the proper sketch using `create_sketch` or `create_sketch_on_offset_plane` before adding geometry. This ensures the correct reference plane is used.
+    - **Top-Face Features:** For features intended for the top surface (like button openings), use `create_sketch_on_offset_plane` with an offset equal to the block's height and confirm the sketch is positioned at the correct Z value.
+    - **Distinct Sketches for Operations:** Use separate sketches for base extrusions and cut operations (e.g., avoid reusing the same sketch for both extrude and cut_extrude) to maintain clarity and prevent unintended geometry modifications.
+    - **Validation:** Use the `sketches` tool to list available sketches and confirm names before referencing them in other operations.
+
+    - **Feature Operations & Parameters:**
+    - **Extrude vs. Cut:** When using extrude operations, verify that the direction vector is correctly defined (defaults to positive Z if omitted) and that distances (extrusion or cut depth) are positive.
+    - **Cut Direction for Top-Face Features:** When cutting features from the top face, ensure the extrusion (cut) direction is set to [0, 0, -1] so that the cut is made downward from the top surface.
+    - **Targeting Entities:** For operations like `cut_extrude` and `rectangular_pattern`, ensure the entity names provided refer to existing, valid bodies.
+    - **Adjustment Consideration:** Always consider the required adjustment on the third axis (depth for XY-based operations, etc.) to maintain proper alignment and avoid unintended modifications.
+
+    By following these guidelines, you help ensure that operations are applied to the correct geometry and that the overall modeling process remains stable and predictable.
+""").strip()
+
+_MEMORY_PROMPT = dedent("""
+    Follow these steps for each interaction:
+
+    1. Memory Retrieval:
+    - Always begin your chat by saying only "Remembering..." and retrieve all relevant information
+      from your knowledge graph
+    - Always refer to your knowledge graph as your "memory"
+
+    2. Memory
+    - While conversing with the user, be attentive to any new information that falls into these categories:
+        a) Basic Identity (age, gender, location, job title, education level, etc.)
+        b) Behaviors (interests, habits, etc.)
+        c) Preferences (communication style, preferred language, etc.)
+        d) Goals (goals, targets, aspirations, etc.)
+        e) Relationships (personal and professional relationships up to 3 degrees of separation)
+
+    3. Memory Update:
+    - If any new information was gathered during the interaction, update your memory as follows:
+        a) Create entities for recurring organizations, people, and significant events
+        b) Connect them to the current entities using relations
+        b) Store facts about them as observations
+""").strip()
+
+
 class MCPToolsConfigModel(BaseModel):
     enabled: Annotated[
         bool,
@@ -290,7 +349,7 @@ class MCPToolsConfigModel(BaseModel):
         ),
         UISchema(items=UISchema(collapsible=False, hide_title=True, title_fields=["key", "enabled"])),
     ] = [
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="filesystem",
             command="npx",
             args=[
@@ -300,101 +359,57 @@ class MCPToolsConfigModel(BaseModel):
             ],
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="vscode",
             command="http://127.0.0.1:6010/sse",
             args=[],
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="bing-search",
             command="http://127.0.0.1:6030/sse",
             args=[],
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="giphy",
             command="http://127.0.0.1:6040/sse",
             args=[],
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="fusion",
             command="http://127.0.0.1:6050/sse",
             args=[],
-            prompt=dedent("""
-                When creating models using the Fusion tool suite, keep these guidelines in mind:
-
-                - **Coordinate System & Planes:**
-                - **Axes:** Z is vertical, X is horizontal, and Y is depth.
-                - **Primary Planes:**
-                    - **XY:** Represents top and bottom surfaces (use the top or bottom Z coordinate as needed).
-                    - **XZ:** Represents the front and back surfaces (use the appropriate Y coordinate).
-                    - **YZ:** Represents the left and right surfaces (use the appropriate X coordinate).
-
-                - **Sketch & Geometry Management:**
-                - **Sketch Creation:** Always create or select the proper sketch using `create_sketch` or `create_sketch_on_offset_plane` before adding geometry. This ensures the correct reference plane is used.
-                - **Top-Face Features:** For features intended for the top surface (like button openings), use `create_sketch_on_offset_plane` with an offset equal to the block's height and confirm the sketch is positioned at the correct Z value.
-                - **Distinct Sketches for Operations:** Use separate sketches for base extrusions and cut operations (e.g., avoid reusing the same sketch for both extrude and cut_extrude) to maintain clarity and prevent unintended geometry modifications.
-                - **Validation:** Use the `sketches` tool to list available sketches and confirm names before referencing them in other operations.
-
-                - **Feature Operations & Parameters:**
-                - **Extrude vs. Cut:** When using extrude operations, verify that the direction vector is correctly defined (defaults to positive Z if omitted) and that distances (extrusion or cut depth) are positive.
-                - **Cut Direction for Top-Face Features:** When cutting features from the top face, ensure the extrusion (cut) direction is set to [0, 0, -1] so that the cut is made downward from the top surface.
-                - **Targeting Entities:** For operations like `cut_extrude` and `rectangular_pattern`, ensure the entity names provided refer to existing, valid bodies.
-                - **Adjustment Consideration:** Always consider the required adjustment on the third axis (depth for XY-based operations, etc.) to maintain proper alignment and avoid unintended modifications.
-
-                By following these guidelines, you help ensure that operations are applied to the correct geometry and that the overall modeling process remains stable and predictable.
-            """).strip(),
+            prompt=_FUSION_PROMPT,
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="memory",
             command="npx",
             args=["-y", "@modelcontextprotocol/server-memory"],
-            prompt=dedent("""
-                Follow these steps for each interaction:
-
-                1. Memory Retrieval:
-                - Always begin your chat by saying only "Remembering..." and retrieve all relevant information
-                  from your knowledge graph
-                - Always refer to your knowledge graph as your "memory"
-
-                2. Memory
-                - While conversing with the user, be attentive to any new information that falls into these categories:
-                    a) Basic Identity (age, gender, location, job title, education level, etc.)
-                    b) Behaviors (interests, habits, etc.)
-                    c) Preferences (communication style, preferred language, etc.)
-                    d) Goals (goals, targets, aspirations, etc.)
-                    e) Relationships (personal and professional relationships up to 3 degrees of separation)
-
-                3. Memory Update:
-                - If any new information was gathered during the interaction, update your memory as follows:
-                    a) Create entities for recurring organizations, people, and significant events
-                    b) Connect them to the current entities using relations
-                    b) Store facts about them as observations
-            """).strip(),
+            prompt=_MEMORY_PROMPT,
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="sequential-thinking",
             command="npx",
             args=["-y", "@modelcontextprotocol/server-sequential-thinking"],
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="open-deep-research",
             command="http://127.0.0.1:6020/sse",
             args=[],
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="open-deep-research-clone-personal",
             command="http://127.0.0.1:6061/sse",
             args=[],
             enabled=False,
         ),
-        MCPServerConfig(
+        MCPServerConfig.model_construct(
             key="web-research-personal",
             command="http://127.0.0.1:6060/sse",
             args=[],
@@ -413,8 +428,11 @@ class MCPToolsConfigModel(BaseModel):
     def mcp_servers(self) -> list[MCPServerConfig]:
         """
         Returns a list of all MCP servers, including both hosted and personal configurations.
+        Returns an empty list when tools are disabled.
         """
-        return self.hosted_mcp_servers.mcp_servers + self.personal_mcp_servers
+        if not self.enabled:
+            return []
+        return [*self.hosted_mcp_servers.mcp_servers, *self.personal_mcp_servers]
 
 
 # the workbench app builds dynamic forms based on the configuration model and UI schema
@@ -1,6 +1,9 @@
+import asyncio
 import logging
 from abc import abstractmethod
+from collections import OrderedDict
 from enum import StrEnum
+from hashlib import sha256
 from os import path
 from pathlib import Path
 from typing import Any, Protocol
@@ -9,6 +12,7 @@ import deepmerge
 import openai_client
 from assistant.agents.document import gc_draft_content_feedback_config, gc_draft_outline_feedback_config
 from assistant_extensions.attachments import AttachmentsExtension
+from openai import AsyncOpenAI
 from openai.types.chat import (
     ChatCompletionMessageParam,
     ChatCompletionSystemMessageParam,
@@ -21,6 +25,10 @@ from semantic_workbench_api_model.workbench_model import (
     NewConversationMessage,
 )
 from semantic_workbench_assistant.assistant_app import ConversationContext, storage_directory_for_context
+from semantic_workbench_assistant.config import (
+    ConfigSecretStrJsonSerializationMode,
+    config_secret_str_serialization_context,
+)
 
 from ...config import AssistantConfigModel
 from .guided_conversation import GC_ConversationStatus, GC_UserDecision, GuidedConversation
@@ -72,13 +80,12 @@ class StepDraftOutline(StepProtocol):
         method_metadata_key = "_step_draft_outline"
 
         # get conversation related info -- for now, if no message, assuming no prior conversation
-        participants_list = await context.get_participants(include_inactive=True)
-        if message is not None:
-            conversation = await context.get_messages(before=message.id)
-            if message.message_type == MessageType.chat:
-                conversation.messages.append(message)
-        else:
-            conversation = await context.get_messages()
+        participants_list, conversation = await asyncio.gather(
+            context.get_participants(include_inactive=True),
+            context.get_messages(before=message.id) if message is not None else context.get_messages(),
+        )
+        if message is not None and message.message_type == MessageType.chat:
+            conversation.messages.append(message)
 
         # get attachments related info
         attachment_messages = await attachments_ext.get_completion_messages_for_attachments(
@@ -100,23 +107,23 @@ class StepDraftOutline(StepProtocol):
             chat_completion_messages.append(_outline_system_message(outline))
 
         # make completion call to openai
-        async with openai_client.create_client(config.service_config) as client:
-            try:
-                completion = await client.chat.completions.create(
-                    messages=chat_completion_messages,
-                    model=config.request_config.openai_model,
-                    response_format={"type": "text"},
-                )
-                new_outline = completion.choices[0].message.content
-                _on_success_metadata_update(metadata, method_metadata_key, config, chat_completion_messages, completion)
-
-            except Exception as e:
-                logger.exception("Document Agent State: Exception occurred calling openai chat completion")
-                new_outline = (
-                    "An error occurred while calling the OpenAI API. Is it configured correctly?"
-                    "View the debug inspector for more information."
-                )
-                _on_error_metadata_update(metadata, method_metadata_key, config, chat_completion_messages, e)
+        client = await _get_openai_client(config.service_config)
+        try:
+            completion = await client.chat.completions.create(
+                messages=chat_completion_messages,
+                model=config.request_config.openai_model,
+                response_format={"type": "text"},
+            )
+            new_outline = completion.choices[0].message.content
+            _on_success_metadata_update(metadata, method_metadata_key, config, chat_completion_messages, completion)
+
+        except Exception as e:
+            logger.exception("Document Agent State: Exception occurred calling openai chat completion")
+            new_outline = (
+                "An error occurred while calling the OpenAI API. Is it configured correctly?"
+                "View the debug inspector for more information."
+            )
+            _on_error_metadata_update(metadata, method_metadata_key, config, chat_completion_messages, e)
 
         # store only latest version for now (will keep all versions later as need arises)
         if new_outline is not None:
@@ -250,13 +257,12 @@ class StepDraftContent(StepProtocol):
         method_metadata_key = "_step_draft_content"
 
         # get conversation related info -- for now, if no message, assuming no prior conversation
-        participants_list = await context.get_participants(include_inactive=True)
-        if message is not None:
-            conversation = await context.get_messages(before=message.id)
-            if message.message_type == MessageType.chat:
-                conversation.messages.append(message)
-        else:
-            conversation = await context.get_messages()
+        participants_list, conversation = await asyncio.gather(
+            context.get_participants(include_inactive=True),
+            context.get_messages(before=message.id) if message is not None else context.get_messages(),
+        )
+        if message is not None and message.message_type == MessageType.chat:
+            conversation.messages.append(message)
 
         # get attachments related info
         attachment_messages = await attachments_ext.get_completion_messages_for_attachments(
@@ -284,23 +290,23 @@ class StepDraftContent(StepProtocol):
 
         # make completion call to openai
         content: str | None = None
-        async with openai_client.create_client(config.service_config) as client:
-            try:
-                completion = await client.chat.completions.create(
-                    messages=chat_completion_messages,
-                    model=config.request_config.openai_model,
-                    response_format={"type": "text"},
-                )
-                content = completion.choices[0].message.content
-                _on_success_metadata_update(metadata, method_metadata_key, config, chat_completion_messages, completion)
-
-            except Exception as e:
-                logger.exception(f"Document Agent State: Exception occurred calling openai chat completion: {e}")
-                content = (
-                    "An error occurred while calling the OpenAI API. Is it configured correctly?"
-                    "View the debug inspector for more information."
-                )
-                _on_error_metadata_update(metadata, method_metadata_key, config, chat_completion_messages, e)
+        client = await _get_openai_client(config.service_config)
+        try:
+            completion = await client.chat.completions.create(
+                messages=chat_completion_messages,
+                model=config.request_config.openai_model,
+                response_format={"type": "text"},
+            )
+            content = completion.choices[0].message.content
+            _on_success_metadata_update(metadata, method_metadata_key, config, chat_completion_messages, completion)
+
+        except Exception as e:
+            logger.exception(f"Document Agent State: Exception occurred calling openai chat completion: {e}")
+            content = (
+                "An error occurred while calling the OpenAI API. Is it configured correctly?"
+                "View the debug inspector for more information."
+            )
+            _on_error_metadata_update(metadata, method_metadata_key, config, chat_completion_messages, e)
 
         if content is not None:
             # store only latest version for now (will keep all versions later as need arises)
@@ -481,6 +487,33 @@ class State(BaseModel):
 #
 
 
+# Shared clients, keyed on a hash of the service config so secrets are not kept in the keys. Bounded so that
+# config or key changes don't accumulate clients; the least recently used client is closed when evicted.
+_OPENAI_CLIENTS_MAX_SIZE = 4
+_openai_clients: OrderedDict[str, AsyncOpenAI] = OrderedDict()
+
+
+async def _get_openai_client(service_config: openai_client.ServiceConfig) -> AsyncOpenAI:
+    """
+    Get a shared client for the service config, so its connection pool is reused across steps.
+    """
+    serialized_config = service_config.model_dump_json(
+        context=config_secret_str_serialization_context(ConfigSecretStrJsonSerializationMode.serialize_value)
+    )
+    key = sha256(serialized_config.encode()).hexdigest()
+    client = _openai_clients.get(key)
+    if client is not None:
+        _openai_clients.move_to_end(key)
+        return client
+
+    client = openai_client.create_client(service_config)
+    _openai_clients[key] = client
+    if len(_openai_clients) > _OPENAI_CLIENTS_MAX_SIZE:
+        _, evicted_client = _openai_clients.popitem(last=False)
+        await evicted_client.close()
+    return client
+
+
 def _get_document_agent_conversation_storage_path(context: ConversationContext) -> Path:
     """
     Get the path to the directory for storing files.
@@ -574,11 +607,10 @@ def _chat_history_system_message(
     conversation_messages: list[ConversationMessage],
     participants: list[ConversationParticipant],
 ) -> ChatCompletionSystemMessageParam:
-    chat_history_message_list = []
-    for conversation_message in conversation_messages:
-        chat_history_message = _format_message(conversation_message, participants)
-        chat_history_message_list.append(chat_history_message)
-    chat_history_str = " ".join(chat_history_message_list)
+    participant_names = {participant.id: participant.name for participant in participants}
+    chat_history_str = " ".join(
+        _format_message(conversation_message, participant_names) for conversation_message in conversation_messages
+    )
 
     message: ChatCompletionSystemMessageParam = {
         "role": "system",
@@ -652,21 +684,14 @@ def _on_success_metadata_update(
     chat_completion_messages: list[ChatCompletionMessageParam],
     completion: Any,
 ) -> None:
-    deepmerge.always_merger.merge(
-        metadata,
-        {
-            "debug": {
-                f"{method_metadata_key}": {
-                    "request": {
-                        "model": config.request_config.openai_model,
-                        "messages": chat_completion_messages,
-                        "max_tokens": config.request_config.response_tokens,
-                    },
-                    "response": completion.model_dump() if completion else "[no response from openai]",
-                },
-            }
+    metadata.setdefault("debug", {})[method_metadata_key] = {
+        "request": {
+            "model": config.request_config.openai_model,
+            "messages": chat_completion_messages,
+            "max_tokens": config.request_config.response_tokens,
         },
-    )
+        "response": completion.model_dump() if completion else "[no response from openai]",
+    }
 
 
 @staticmethod
@@ -677,32 +702,21 @@ def _on_error_metadata_update(
     chat_completion_messages: list[ChatCompletionMessageParam],
     e: Exception,
 ) -> None:
-    deepmerge.always_merger.merge(
-        metadata,
-        {
-            "debug": {
-                f"{method_metadata_key}": {
-                    "request": {
-                        "model": config.request_config.openai_model,
-                        "messages": chat_completion_messages,
-                    },
-                    "error": str(e),
-                },
-            }
+    metadata.setdefault("debug", {})[method_metadata_key] = {
+        "request": {
+            "model": config.request_config.openai_model,
+            "messages": chat_completion_messages,
         },
-    )
+        "error": str(e),
+    }
 
 
 # borrowed from Prospector chat.py
 @staticmethod
-def _format_message(message: ConversationMessage, participants: list[ConversationParticipant]) -> str:
+def _format_message(message: ConversationMessage, participant_names: dict[str, str]) -> str:
     """
     Format a conversation message for display.
     """
-    conversation_participant = next(
-        (participant for participant in participants if participant.id == message.sender.participant_id),
-        None,
-    )
-    participant_name = conversation_participant.name if conversation_participant else "unknown"
+    participant_name = participant_names.get(message.sender.participant_id, "unknown")
     message_datetime = message.timestamp.strftime("%Y-%m-%d %H:%M:%S")
     return f"[{participant_name} - {message_datetime}]: {message.content}"
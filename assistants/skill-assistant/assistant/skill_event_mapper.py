@@ -1,4 +1,6 @@
-from typing import Protocol
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
 
 from events import events as skill_events
 from semantic_workbench_api_model.workbench_model import (
@@ -12,6 +14,9 @@ from semantic_workbench_assistant.assistant_app import (
 
 from .logging import extra_data, logger
 
+# Handlers take the concrete event type they are registered for, so the event parameter is loose here.
+EventHandler = Callable[[Any, dict[str, Any] | None], Awaitable[None]]
+
 
 class SkillEventMapperProtocol(Protocol):
     async def map(
@@ -23,6 +28,12 @@ class SkillEventMapperProtocol(Protocol):
 class SkillEventMapper(SkillEventMapperProtocol):
     def __init__(self, conversation_context: ConversationContext) -> None:
         self.conversation_context = conversation_context
+        self._handlers: dict[type, EventHandler] = {
+            skill_events.MessageEvent: self._handle_message_event,
+            skill_events.InformationEvent: self._handle_information_event,
+            skill_events.ErrorEvent: self._handle_error_event,
+            skill_events.StatusUpdatedEvent: self._handle_status_updated_event,
+        }
 
     async def map(
         self,
@@ -32,44 +43,61 @@ class SkillEventMapper(SkillEventMapperProtocol):
         Maps events emitted by the skill assistant (from running actions or
         routines) to message types understood by the Semantic Workbench.
         """
-        metadata = {"debug": skill_event.metadata} if skill_event.metadata else None
-        logger.debug(
-            "Mapping skill event to Workbench conversation message.",
-            extra_data({
-                "event_id": skill_event.id,
-                "conversation_context_id": self.conversation_context.id,
-            }),
+        event_metadata = skill_event.metadata
+        metadata = {"debug": event_metadata} if event_metadata else None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Mapping skill event to Workbench conversation message.",
+                extra_data({
+                    "event_id": skill_event.id,
+                    "conversation_context_id": self.conversation_context.id,
+                }),
+            )
+
+        # Walk the MRO so events that subclass one of the base event types are
+        # handled like their base, as they were with the previous `match`.
+        handler = next(
+            (self._handlers[cls] for cls in type(skill_event).__mro__ if cls in self._handlers),
+            self._handle_unhandled_event,
         )
+        await handler(skill_event, metadata)
 
-        match skill_event:
-            case skill_events.MessageEvent():
-                await self.conversation_context.send_messages(
-                    NewConversationMessage(
-                        content=skill_event.message or "",
-                        metadata=metadata,
-                    )
-                )
+    async def _handle_message_event(
+        self, skill_event: skill_events.MessageEvent, metadata: dict[str, Any] | None
+    ) -> None:
+        await self.conversation_context.send_messages(
+            NewConversationMessage(
+                content=skill_event.message or "",
+                metadata=metadata,
+            )
+        )
 
-            case skill_events.InformationEvent():
-                if skill_event.message:
-                    await self.conversation_context.send_messages(
-                        NewConversationMessage(
-                            content=f"Information event: {skill_event.message}",
-                            message_type=MessageType.notice,
-                            metadata=metadata,
-                        ),
-                    )
+    async def _handle_information_event(
+        self, skill_event: skill_events.InformationEvent, metadata: dict[str, Any] | None
+    ) -> None:
+        if skill_event.message:
+            await self.conversation_context.send_messages(
+                NewConversationMessage(
+                    content=f"Information event: {skill_event.message}",
+                    message_type=MessageType.notice,
+                    metadata=metadata,
+                ),
+            )
 
-            case skill_events.ErrorEvent():
-                await self.conversation_context.send_messages(
-                    NewConversationMessage(
-                        content=skill_event.message or "",
-                        metadata=metadata,
-                    )
-                )
+    async def _handle_error_event(self, skill_event: skill_events.ErrorEvent, metadata: dict[str, Any] | None) -> None:
+        await self.conversation_context.send_messages(
+            NewConversationMessage(
+                content=skill_event.message or "",
+                metadata=metadata,
+            )
+        )
 
-            case skill_events.StatusUpdatedEvent():
-                await self.conversation_context.update_participant_me(UpdateParticipant(status=skill_event.message))
+    async def _handle_status_updated_event(
+        self, skill_event: skill_events.StatusUpdatedEvent, metadata: dict[str, Any] | None
+    ) -> None:
+        await self.conversation_context.update_participant_me(UpdateParticipant(status=skill_event.message))
 
-            case _:
-                logger.warning("Unhandled event.", extra_data({"event": skill_event}))
+    async def _handle_unhandled_event(
+        self, skill_event: skill_events.EventProtocol, metadata: dict[str, Any] | None
+    ) -> None:
+        logger.warning("Unhandled event.", extra_data({"event": skill_event}))
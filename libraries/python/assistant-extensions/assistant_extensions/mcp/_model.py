@@ -168,12 +168,18 @@ class HostedMCPServerConfig(MCPServerConfig):
         prompts_to_auto_include: list[str] = [],
     ) -> "HostedMCPServerConfig":
         """Returns a HostedMCPServerConfig object with the command (URL) set from the environment variable."""
-        env_value = os.getenv(url_env_var.upper()) or os.getenv(url_env_var.lower()) or ""
+        env_value = os.environ.get(url_env_var.upper()) or os.environ.get(url_env_var.lower(), "")
 
         enabled = enabled and bool(env_value)
 
-        return HostedMCPServerConfig(
-            key=key, command=env_value, enabled=enabled, roots=roots, prompts_to_auto_include=prompts_to_auto_include
+        # the arguments are developer-supplied defaults, so skip validation; copy the lists so instances
+        # don't share the mutable default arguments
+        return HostedMCPServerConfig.model_construct(
+            key=key,
+            command=env_value,
+            enabled=enabled,
+            roots=list(roots),
+            prompts_to_auto_include=list(prompts_to_auto_include),
         )
 
 
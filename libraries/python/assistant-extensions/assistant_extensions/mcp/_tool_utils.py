@@ -1,8 +1,8 @@
 # utils/tool_utils.py
 import asyncio
 import logging
+from collections.abc import AsyncGenerator, Collection
 from textwrap import dedent
-from typing import AsyncGenerator
 
 import deepmerge
 from mcp import Tool
@@ -18,7 +18,7 @@ from ._model import (
 logger = logging.getLogger(__name__)
 
 
-def retrieve_mcp_tools_from_sessions(mcp_sessions: list[MCPSession], exclude_tools: list[str] = []) -> list[Tool]:
+def retrieve_mcp_tools_from_sessions(mcp_sessions: list[MCPSession], exclude_tools: Collection[str] = ()) -> list[Tool]:
     """
     Retrieve tools from all MCP sessions, excluding any tools that are disabled in the tools config
     and any duplicate keys (names) - first tool wins.
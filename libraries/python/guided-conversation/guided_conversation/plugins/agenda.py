@@ -4,11 +4,12 @@
 import logging
 from typing import Annotated, Any
 
-from pydantic import Field, ValidationError
+from pydantic import ConfigDict, Field, ValidationError
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
 from semantic_kernel.functions import KernelArguments
 from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.prompt_template import Jinja2PromptTemplate, PromptTemplateConfig
 
 from guided_conversation.utils.base_model_llm import BaseModelLLM
 from guided_conversation.utils.conversation_helpers import Conversation, ConversationMessageType
@@ -40,15 +41,29 @@ and treatment history (2 turns), item 3 = explore treatment history (3 turns)."<
 Previous attempts to update the agenda:
 {{ previous_attempts }}</message>"""
 
+# Built once so that retries in the error correction loop reuse the same template object.
+_AGENDA_ERROR_CORRECTION_PROMPT_TEMPLATE = Jinja2PromptTemplate(
+    prompt_template_config=PromptTemplateConfig(
+        name="error_correction",
+        template=AGENDA_ERROR_CORRECTION_SYSTEM_TEMPLATE,
+        template_format="jinja2",
+    )
+)
+
 UPDATE_AGENDA_TOOL = "update_agenda"
 
 
 class _BaseAgendaItem(BaseModelLLM):
+    # Agenda snapshots are replaced wholesale, never mutated, so they can be frozen.
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     title: str = Field(description="Brief description of the item")
     resource: int = Field(description="Number of turns required for the item")
 
 
 class _BaseAgenda(BaseModelLLM):
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     items: list[_BaseAgendaItem] = Field(
         description="Ordered list of items to be completed in the remainder of the conversation",
         default_factory=list,
@@ -89,6 +104,15 @@ class Agenda:
 
         self.agenda = _BaseAgenda()
 
+        # Register the update tool and prepare the error correction settings once; they are reused on every retry
+        self.kernel.add_function(plugin_name=self.id, function=self.update_agenda_items)
+        self.req_settings = self.kernel.get_prompt_execution_settings_from_service_id(self.service_id)
+        self.req_settings.max_tokens = 2000  # type: ignore
+        self.req_settings.tool_choice = "auto"  # type: ignore
+        self.req_settings.function_choice_behavior = FunctionChoiceBehavior.Auto(
+            auto_invoke=False, filters={"included_plugins": [self.id]}
+        )
+
     async def update_agenda(
         self,
         items: list[dict[str, str]],
@@ -112,11 +136,14 @@ class Agenda:
             PluginOutput: A PluginOutput object with the success status. Does not generate any messages.
         """
         previous_attempts = []
+        # Only needed to fix an invalid update, so it is rendered on the first retry
+        conversation_repr: str | None = None
         while True:
             try:
-                # Try to update the agenda, and do extra validation checks
-                self.agenda.items = items  # type: ignore
-                self._validate_agenda_update(items, remaining_turns)
+                # Validate the proposed agenda and do extra validation checks before committing it
+                candidate = _BaseAgenda.model_validate({"items": items})
+                self._validate_agenda_update(candidate.items, remaining_turns)
+                self.agenda = candidate
                 self.logger.info(f"Agenda updated successfully: {self.get_agenda_for_prompt()}")
                 return PluginOutput(True, [])
             except (ValidationError, ValueError) as e:
@@ -133,7 +160,11 @@ class Agenda:
                     return PluginOutput(False, [])
                 else:
                     self.logger.info(f"Attempting to fix the agenda error. Attempt {len(previous_attempts)}.")
-                    response = await self._fix_agenda_error(llm_formatted_attempts, conversation)
+                    if conversation_repr is None:
+                        conversation_repr = conversation.get_repr_for_prompt(
+                            exclude_types=[ConversationMessageType.REASONING]
+                        )
+                    response = await self._fix_agenda_error(llm_formatted_attempts, conversation_repr)
                     if response is None:
                         raise ValueError("Invalid response from the LLM.")
                     if response["validation_result"] != ToolValidationResult.SUCCESS:
@@ -151,15 +182,14 @@ class Agenda:
         Returns:
             str: A string representation of the agenda.
         """
-        agenda_json = self.agenda.model_dump()
-        agenda_items = agenda_json.get("items", [])
+        agenda_items = self.agenda.items
         if len(agenda_items) == 0:
             return "None"
-        agenda_str = "\n".join([
-            f"{i + 1}. [{format_resource(item['resource'], ResourceConstraintUnit.TURNS)}] {item['title']}"
+        agenda_str = "\n".join(
+            f"{i + 1}. [{format_resource(item.resource, ResourceConstraintUnit.TURNS)}] {item.title}"
             for i, item in enumerate(agenda_items)
-        ])
-        total_resource = format_resource(sum([item["resource"] for item in agenda_items]), ResourceConstraintUnit.TURNS)
+        )
+        total_resource = format_resource(sum(item.resource for item in agenda_items), ResourceConstraintUnit.TURNS)
         agenda_str += f"\nTotal = {total_resource}"
         return agenda_str
 
@@ -178,40 +208,37 @@ class Agenda:
     ):
         pass
 
-    async def _fix_agenda_error(self, previous_attempts: str, conversation: Conversation) -> dict[Any, Any]:
+    async def _fix_agenda_error(self, previous_attempts: str, conversation_repr: str) -> dict[Any, Any]:
         """Calls an LLM to try and fix an error in the agenda update."""
-        req_settings = self.kernel.get_prompt_execution_settings_from_service_id(self.service_id)
-        req_settings.max_tokens = 2000  # type: ignore
-        req_settings.tool_choice = "auto"  # type: ignore
-        self.kernel.add_function(plugin_name=self.id, function=self.update_agenda_items)
-        req_settings.function_choice_behavior = FunctionChoiceBehavior.Auto(
-            auto_invoke=False, filters={"included_plugins": [self.id]}
-        )
-
         arguments = KernelArguments(
-            conversation_history=conversation.get_repr_for_prompt(exclude_types=[ConversationMessageType.REASONING]),
+            conversation_history=conversation_repr,
             previous_attempts=previous_attempts,
         )
 
         return await fix_error(
             kernel=self.kernel,
-            prompt_template=AGENDA_ERROR_CORRECTION_SYSTEM_TEMPLATE,
-            req_settings=req_settings,  # type: ignore
+            prompt_template=_AGENDA_ERROR_CORRECTION_PROMPT_TEMPLATE,
+            req_settings=self.req_settings,  # type: ignore
             arguments=arguments,
         )
 
-    def _validate_agenda_update(self, items: list[dict[str, str]], remaining_turns: int) -> None:
+    def _validate_agenda_update(self, items: list[_BaseAgendaItem], remaining_turns: int) -> None:
         """Validates if any constraints were violated while performing the agenda update.
 
         Args:
-            items (list[dict[str, str]]): A list of agenda items.
+            items (list[_BaseAgendaItem]): The validated agenda items.
             remaining_turns (int): The number of remaining turns.
 
         Raises:
             ValueError: If any validation checks fail.
         """
-        # The total, proposed allocation of resources.
-        total_resources = sum([item["resource"] for item in items])  # type: ignore
+        # The total, proposed allocation of resources, and whether any item has a non-positive allocation.
+        total_resources = 0
+        has_nonpositive_resource = False
+        for item in items:
+            total_resources += item.resource
+            if item.resource <= 0:
+                has_nonpositive_resource = True
 
         violations = []
         # In maximum mode, the total resources should not exceed the remaining turns
@@ -229,7 +256,7 @@ class Agenda:
             violations.append(f"{total_resource_instruction}; but the current total is {total_resources}.")
 
         # Check if any item has a resource value of 0
-        if any(item["resource"] <= 0 for item in items):  # type: ignore
+        if has_nonpositive_resource:
             violations.append("All items must have a resource value greater than 0.")
 
         # Raise an error if any violations were found
@@ -253,5 +280,5 @@ class Agenda:
         max_agenda_retries: int = 2,
     ) -> "Agenda":
         agenda = cls(kernel, service_id, resource_constraint_mode, max_agenda_retries)
-        agenda.agenda.items = json_data["agenda"]["items"]
+        agenda.agenda = _BaseAgenda.model_validate({"items": json_data["agenda"]["items"]})
         return agenda
@@ -8,9 +8,10 @@ from dataclasses import dataclass
 from pydantic import ValidationError
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.function_calling_utils import kernel_function_metadata_to_function_call_format
-from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.contents import ChatMessageContent
 from semantic_kernel.functions import KernelArguments
+from semantic_kernel.prompt_template.prompt_template_base import PromptTemplateBase
 
 from guided_conversation.utils.openai_tool_calling import parse_function_result, validate_tool_calling
 
@@ -41,7 +42,10 @@ def format_kernel_functions_as_tools(kernel: Kernel, functions: list[str]):
 
 
 async def fix_error(
-    kernel: Kernel, prompt_template: str, req_settings: AzureChatCompletion, arguments: KernelArguments
+    kernel: Kernel,
+    prompt_template: str | PromptTemplateBase,
+    req_settings: PromptExecutionSettings,
+    arguments: KernelArguments,
 ) -> dict:
     """Invokes the error correction plugin. If a plugin is called & fails during execution, this function will retry
     the plugin. At a high level, we recommend the following steps when calling a plugin:
@@ -54,19 +58,24 @@ async def fix_error(
 
     Args:
         kernel (Kernel): The kernel object.
-        prompt_template (str): The prompt template for the plugin.
-        req_settings (AzureChatCompletion): The prompt execution settings.
+        prompt_template (str | PromptTemplateBase): The prompt template for the plugin, either as a jinja2 string or
+        as an already constructed prompt template (preferred when the same template is used repeatedly).
+        req_settings (PromptExecutionSettings): The prompt execution settings.
         arguments (KernelArguments): The kernel arguments.
 
     Returns:
         dict: The result of the plugin call.
     """
+    if isinstance(prompt_template, PromptTemplateBase):
+        template_kwargs = {"prompt_template": prompt_template}
+    else:
+        template_kwargs = {"prompt": prompt_template}
     kernel_function_obj = kernel.add_function(
-        prompt=prompt_template,
         function_name="error_correction",
         plugin_name="error_correction",
         template_format="jinja2",
         prompt_execution_settings=req_settings,
+        **template_kwargs,
     )
 
     result = await kernel.invoke(function=kernel_function_obj, arguments=arguments)
@@ -7,6 +7,7 @@ import logging
 import math
 import time
 from enum import StrEnum
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict
 
@@ -45,6 +46,7 @@ class ResourceConstraint(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+@lru_cache(maxsize=64, typed=True)
 def format_resource(quantity: float, unit: ResourceConstraintUnit) -> str:
     """Get formatted string for a given quantity and unit (e.g. 1 second, 20 seconds)"""
     if unit != ResourceConstraintUnit.TURNS:
@@ -0,0 +1,49 @@
+import json
+from typing import Any
+
+import pytest
+from pydantic import Field
+from semantic_kernel import Kernel
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatPromptExecutionSettings
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents import ChatHistory, ChatMessageContent, FunctionCallContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.contents.utils.finish_reason import FinishReason
+
+SERVICE_ID = "fake-chat"
+
+
+class FakeChatCompletion(ChatCompletionClientBase):
+    """A chat completion service that records the rendered chat history and replies with queued tool calls."""
+
+    tool_call_responses: list[tuple[str, dict[str, Any]]] = Field(default_factory=list)
+    received_chat_histories: list[ChatHistory] = Field(default_factory=list)
+
+    def get_prompt_execution_settings_class(self) -> type[OpenAIChatPromptExecutionSettings]:
+        return OpenAIChatPromptExecutionSettings
+
+    async def _inner_get_chat_message_contents(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> list[ChatMessageContent]:
+        self.received_chat_histories.append(chat_history)
+        name, arguments = self.tool_call_responses.pop(0)
+        return [
+            ChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                items=[FunctionCallContent(id="call-1", name=name, arguments=json.dumps(arguments))],
+                finish_reason=FinishReason.TOOL_CALLS,
+            )
+        ]
+
+
+@pytest.fixture
+def chat_service() -> FakeChatCompletion:
+    return FakeChatCompletion(service_id=SERVICE_ID, ai_model_id="fake-model")
+
+
+@pytest.fixture
+def kernel(chat_service: FakeChatCompletion) -> Kernel:
+    kernel = Kernel()
+    kernel.add_service(chat_service)
+    return kernel
@@ -0,0 +1,62 @@
+from guided_conversation.plugins.agenda import Agenda
+from guided_conversation.utils.conversation_helpers import Conversation
+from guided_conversation.utils.resources import ResourceConstraintMode
+from semantic_kernel import Kernel
+
+from .conftest import SERVICE_ID, FakeChatCompletion
+
+
+async def test_update_agenda_commits_valid_items(kernel: Kernel) -> None:
+    agenda = Agenda(kernel, SERVICE_ID, ResourceConstraintMode.EXACT)
+    items = [{"title": "Ask for name", "resource": "1"}, {"title": "Ask for date of birth", "resource": "2"}]
+
+    result = await agenda.update_agenda(items, remaining_turns=3, conversation=Conversation())
+
+    assert result.update_successful
+    assert [(item.title, item.resource) for item in agenda.agenda.items] == [
+        ("Ask for name", 1),
+        ("Ask for date of birth", 2),
+    ]
+
+
+async def test_update_agenda_keeps_items_when_update_is_invalid(kernel: Kernel) -> None:
+    agenda = Agenda(kernel, SERVICE_ID, ResourceConstraintMode.MAXIMUM, max_agenda_retries=0)
+    await agenda.update_agenda(
+        [{"title": "Ask for name", "resource": "1"}], remaining_turns=3, conversation=Conversation()
+    )
+    original_items = agenda.agenda.items
+    assert len(original_items) == 1
+
+    result = await agenda.update_agenda(
+        [{"title": "Ask for name", "resource": "0"}, {"title": "Ask for date of birth", "resource": "5"}],
+        remaining_turns=3,
+        conversation=Conversation(),
+    )
+
+    assert not result.update_successful
+    assert agenda.agenda.items == original_items
+
+
+async def test_update_agenda_fixes_items_that_exceed_the_turn_budget(
+    kernel: Kernel, chat_service: FakeChatCompletion
+) -> None:
+    agenda = Agenda(kernel, SERVICE_ID, ResourceConstraintMode.EXACT)
+    fixed_items = [{"title": "Ask for name", "resource": 1}, {"title": "Ask for date of birth", "resource": 2}]
+    chat_service.tool_call_responses = [("agenda_plugin-update_agenda", {"items": fixed_items})]
+
+    result = await agenda.update_agenda(
+        [{"title": "Ask for name", "resource": "2"}, {"title": "Ask for date of birth", "resource": "4"}],
+        remaining_turns=3,
+        conversation=Conversation(),
+    )
+
+    assert result.update_successful
+    assert [(item.title, item.resource) for item in agenda.agenda.items] == [
+        ("Ask for name", 1),
+        ("Ask for date of birth", 2),
+    ]
+
+    # the correction prompt told the LLM which turn budget was violated
+    (chat_history,) = chat_service.received_chat_histories
+    rendered = "\n".join(str(message.content) for message in chat_history.messages)
+    assert "must equal the remaining amount (3)" in rendered
@@ -0,0 +1,34 @@
+from guided_conversation.plugins.agenda import _AGENDA_ERROR_CORRECTION_PROMPT_TEMPLATE, Agenda
+from guided_conversation.utils.openai_tool_calling import ToolValidationResult
+from guided_conversation.utils.plugin_helpers import fix_error
+from guided_conversation.utils.resources import ResourceConstraintMode
+from semantic_kernel import Kernel
+from semantic_kernel.functions import KernelArguments
+
+from .conftest import SERVICE_ID, FakeChatCompletion
+
+
+async def test_fix_error_with_prebuilt_template(kernel: Kernel, chat_service: FakeChatCompletion) -> None:
+    agenda = Agenda(kernel, SERVICE_ID, ResourceConstraintMode.EXACT)
+    items = [{"title": "Ask for date of birth", "resource": 2}]
+    chat_service.tool_call_responses = [("agenda_plugin-update_agenda", {"items": items})]
+
+    result = await fix_error(
+        kernel=kernel,
+        prompt_template=_AGENDA_ERROR_CORRECTION_PROMPT_TEMPLATE,
+        req_settings=agenda.req_settings,
+        arguments=KernelArguments(
+            conversation_history="User: hello",
+            previous_attempts="Attempt: []\nError: too few turns",
+        ),
+    )
+
+    assert result["validation_result"] == ToolValidationResult.SUCCESS
+    assert result["tool_args_list"] == [{"items": items}]
+
+    # the prebuilt jinja2 template was rendered with the arguments
+    (chat_history,) = chat_service.received_chat_histories
+    rendered = "\n".join(str(message.content) for message in chat_history.messages)
+    assert "You tried to update the agenda, but the update was invalid." in rendered
+    assert "User: hello" in rendered
+    assert "Error: too few turns" in rendered
@@ -4,6 +4,12 @@ from pathlib import Path
 import yaml
 from skill_library.cli.skill_logger import SkillLogger
 
+try:
+    # Use the libyaml-backed loader when PyYAML was built with it.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Settings:
     """Loads and manages configuration settings from config files."""
@@ -29,11 +35,10 @@ class Settings:
         yaml_config = self.config_dir / "config.yml"
         if yaml_config.exists():
             try:
-                with open(yaml_config, "r") as f:
-                    config = yaml.safe_load(f)
-                    if config:
-                        for key, value in config.items():
-                            setattr(self, key, value)
+                config = yaml.load(yaml_config.read_bytes(), Loader=_YamlLoader)
+                if config:
+                    for key, value in config.items():
+                        setattr(self, key, value)
                 self.logger.info(f"Loaded configuration from {yaml_config}")
                 return
             except Exception as e:
@@ -13,6 +13,24 @@ logger.addHandler(logging.NullHandler())
 logger.setLevel(logging.DEBUG)
 
 
+class CustomEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, BaseModel):
+            return o.model_dump()
+        if isinstance(o, UUID):
+            return str(o)
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, (set, frozenset)):
+            return list(o)
+        # Never fail a log record because of an unserializable value.
+        return str(o)
+
+
+# Shared encoder so formatting a record does not construct a new encoder each time.
+_json_encoder = CustomEncoder()
+
+
 def convert_to_serializable(data: Any) -> Any:
     """
     Recursively convert Pydantic BaseModel instances to dictionaries.
@@ -30,30 +48,17 @@ def convert_to_serializable(data: Any) -> Any:
     return data
 
 
-class CustomEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, UUID):
-            return str(o)
-        if isinstance(o, datetime):
-            return o.isoformat()
-        return super().default(o)
-
-
 def extra_data(data: Any) -> dict[str, Any]:
     """
-    Helper function to use when adding extra data to log messages.
+    Helper function to use when adding extra data to log messages. Pydantic
+    models are converted to dictionaries so that any handler the record
+    propagates to can render them; JSON encoding is left to the formatter.
     """
     extra = {}
 
     # Convert to serializable.
     data = convert_to_serializable(data)
 
-    # Ensure data is a JSON-serializable object.
-    try:
-        data = json.loads(json.dumps(data, cls=CustomEncoder))
-    except Exception as e:
-        data = str(e)
-
     if data:
         extra["data"] = data
 
@@ -63,6 +68,23 @@ def extra_data(data: Any) -> dict[str, Any]:
 extra_data = extra_data
 
 
+# Record attributes that are not copied into the JSON record as extra fields.
+_EXCLUDED_RECORD_KEYS = frozenset({
+    "levelname",
+    "msg",
+    "args",
+    "funcName",
+    "module",
+    "lineno",
+    "name",
+    "message",
+    "asctime",
+    "session_id",
+    "run_id",
+    "data",
+})
+
+
 class JsonFormatter(logging.Formatter):
     def format(self, record) -> str:
         record_dict = record.__dict__
@@ -78,39 +100,26 @@ class JsonFormatter(logging.Formatter):
             "lineNumber": record.lineno,
             "logger": record.name,
         }
-        extra_fields = {
-            key: value
-            for key, value in record.__dict__.items()
-            if key
-            not in [
-                "levelname",
-                "msg",
-                "args",
-                "funcName",
-                "module",
-                "lineno",
-                "name",
-                "message",
-                "asctime",
-                "session_id",
-                "run_id",
-                "data",
-            ]
-        }
+        extra_fields = {key: value for key, value in record_dict.items() if key not in _EXCLUDED_RECORD_KEYS}
         log_record.update(extra_fields)
-        return json.dumps(log_record)
+        try:
+            return _json_encoder.encode(log_record)
+        except (TypeError, ValueError):
+            # The data can't be encoded as JSON (e.g. non-str dict keys or a
+            # circular reference), so log its string form rather than lose the record.
+            log_record["data"] = str(log_record["data"])
+            return _json_encoder.encode(log_record)
 
 
 def file_logging_handler(logfile_path: PathLike, ensure_dir_exists: bool = False) -> logging.FileHandler:
     # Create the data directory if it does not exist.
     data_dir = Path(logfile_path).parent
     if ensure_dir_exists:
-        if not data_dir.exists():
-            data_dir.mkdir()
-    else:
-        if not data_dir.exists():
-            raise FileNotFoundError(f"Logging directory {data_dir} does not exist.")
+        data_dir.mkdir(parents=True, exist_ok=True)
+    elif not data_dir.exists():
+        raise FileNotFoundError(f"Logging directory {data_dir} does not exist.")
 
-    file_handler = logging.FileHandler(Path(logfile_path))
+    # Open the log file on first emit rather than up front.
+    file_handler = logging.FileHandler(Path(logfile_path), delay=True)
     file_handler.setFormatter(JsonFormatter())
     return file_handler
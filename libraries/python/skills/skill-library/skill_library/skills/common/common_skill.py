@@ -1,3 +1,6 @@
+from collections import OrderedDict
+
+import requests
 from assistant_drive import Drive
 from skill_library import LanguageModel, Skill, SkillConfig
 
@@ -16,3 +19,10 @@ class CommonSkill(Skill):
 
     def __init__(self, config: CommonSkillConfig):
         super().__init__(config)
+
+        # Routine modules are reloaded on every call, so state that should outlive a single call lives on the skill.
+        # A shared session lets repeated Bing searches reuse pooled keep-alive connections.
+        self.http_session = requests.Session()
+
+        # Recent Bing search results, keyed on (search_url, query) and stored with the time they were fetched.
+        self.bing_search_cache: OrderedDict[tuple[str, str], tuple[float, list[str]]] = OrderedDict()
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 from typing import Any, Optional, cast
 
 import requests
@@ -6,6 +8,10 @@ from dotenv import load_dotenv
 from skill_library import AskUserFn, EmitFn, RunContext, RunRoutineFn
 from skill_library.skills.common.common_skill import CommonSkill
 
+# Limits for the search cache kept on the common skill. Least recently used entries are evicted first.
+_SEARCH_CACHE_MAX_SIZE = 256
+_SEARCH_CACHE_TTL_SECONDS = 600
+
 
 async def main(
     context: RunContext,
@@ -30,25 +36,40 @@ async def main(
             raise Exception("BING_SUBSCRIPTION_KEY not found in .env.")
         search_url = search_url or os.getenv("BING_SEARCH_URL") or "https://api.bing.microsoft.com/v7.0/search"
 
-    # Search Bing.
-    headers = {"Ocp-Apim-Subscription-Key": subscription_key}
-    params = {"q": q}
+    # Reuse a recent result for the same query.
+    search_cache = common_skill.bing_search_cache
+    cache_key = (search_url, q)
+    cached = search_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL_SECONDS:
+        search_cache.move_to_end(cache_key)
+        urls = cached[1]
+    else:
+        # Search Bing.
+        headers = {"Ocp-Apim-Subscription-Key": subscription_key}
+        params = {"q": q}
 
-    try:
-        response = requests.get(search_url, headers=headers, params=params)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        key_hint = f"{subscription_key[0:3]}...{subscription_key[-3:]}"
-        context.log("Error during Bing search.", {"exception": e.strerror, "url": search_url, "key": key_hint})
-        raise e
+        try:
+            # requests is blocking, so run it off the event loop to let concurrent searches overlap.
+            response = await asyncio.to_thread(
+                common_skill.http_session.get, search_url, headers=headers, params=params
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            key_hint = f"{subscription_key[0:3]}...{subscription_key[-3:]}"
+            context.log("Error during Bing search.", {"exception": e.strerror, "url": search_url, "key": key_hint})
+            raise e
 
-    # Unpack results.
-    search_results = response.json()
-    values = search_results.get("webPages", {}).get("value", "")
-    urls = [str(v["url"]) for v in values]
+        # Unpack results.
+        search_results = response.json()
+        values = search_results.get("webPages", {}).get("value", "")
+        urls = [str(v["url"]) for v in values]
 
-    # Limit number of results.
-    if num_results:
-        urls = urls[:num_results]
+        search_cache[cache_key] = (time.monotonic(), urls)
+        search_cache.move_to_end(cache_key)
+        if len(search_cache) > _SEARCH_CACHE_MAX_SIZE:
+            search_cache.popitem(last=False)
 
-    return urls
+    # Limit number of results. Always return a copy so callers can't modify the cached list.
+    if num_results:
+        return urls[:num_results]
+    return list(urls)
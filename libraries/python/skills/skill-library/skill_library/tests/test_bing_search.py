@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import Any
+
+from assistant_drive import Drive, DriveConfig
+from openai import AsyncOpenAI
+from semantic_workbench_api_model.workbench_model import ConversationMessageList
+from skill_library import RunContext
+from skill_library.skills.common import CommonSkill, CommonSkillConfig
+
+
+class FakeResponse:
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict[str, Any]:
+        return {"webPages": {"value": [{"url": "https://example.com/1"}, {"url": "https://example.com/2"}]}}
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append({"url": url, **kwargs})
+        return FakeResponse()
+
+
+async def test_bing_search_reuses_cached_results(tmp_path: Path) -> None:
+    drive = Drive(DriveConfig(root=str(tmp_path)))
+    skill = CommonSkill(
+        CommonSkillConfig(
+            name="common",
+            language_model=AsyncOpenAI(api_key="test"),
+            drive=drive,
+            bing_subscription_key="test-key",
+        )
+    )
+    session = FakeSession()
+    skill.http_session = session  # type: ignore[assignment]
+
+    async def get_history() -> ConversationMessageList:
+        return ConversationMessageList(messages=[])
+
+    context = RunContext(session_id="test", run_drive=drive, conversation_history=get_history, skills={"common": skill})
+
+    async def run(designation: str, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    async def ask_user(question: str) -> str:
+        raise NotImplementedError
+
+    results = []
+    for _ in range(2):
+        # get_routine reloads the routine module on every call, as it does when run by the engine.
+        bing_search = skill.get_routine("bing_search")
+        assert bing_search is not None
+        results.append(await bing_search(context, {}, lambda event: None, run, ask_user, "semantic workbench"))
+
+    assert results == [["https://example.com/1", "https://example.com/2"]] * 2
+    assert len(session.calls) == 1
+    assert session.calls[0]["params"] == {"q": "semantic workbench"}
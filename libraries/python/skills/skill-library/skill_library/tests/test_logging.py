@@ -0,0 +1,52 @@
+import json
+import logging
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+from skill_library.logging import JsonFormatter, extra_data
+
+
+class Item(BaseModel):
+    name: str
+    count: int
+
+
+def format_data(data: Any) -> dict[str, Any]:
+    record = logging.getLogger("test").makeRecord(
+        "test", logging.INFO, __file__, 1, "message", (), None, extra=extra_data(data)
+    )
+    return json.loads(JsonFormatter().format(record))
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (Item(name="a", count=1), {"name": "a", "count": 1}),
+        (UUID("12345678-1234-5678-1234-567812345678"), "12345678-1234-5678-1234-567812345678"),
+        (datetime(2025, 1, 2, 3, 4, 5), "2025-01-02T03:04:05"),
+        ({"ids": {1}}, {"ids": [1]}),
+        ({"nested": [Item(name="b", count=2)]}, {"nested": [{"name": "b", "count": 2}]}),
+    ],
+)
+def test_json_formatter_encodes_data(data: Any, expected: Any) -> None:
+    log_record = format_data(data)
+
+    assert log_record["message"] == "message"
+    assert log_record["data"] == expected
+
+
+def test_json_formatter_falls_back_to_str_for_unencodable_data() -> None:
+    data = {("a", 1): "tuple key"}
+
+    log_record = format_data(data)
+
+    assert log_record["message"] == "message"
+    assert log_record["data"] == str(data)
+
+
+def test_extra_data_converts_models_for_other_handlers() -> None:
+    # records propagate to the host's handlers, which may not know how to encode pydantic models
+    assert extra_data({"items": [Item(name="a", count=1)]}) == {"data": {"items": [{"name": "a", "count": 1}]}}
@@ -9,9 +9,14 @@ from rich.console import Console
 from mcp_server.evals.common import load_test_cases
 from mcp_server.markdown_edit.comment_analysis import run_comment_analysis
 from mcp_server.types import (
+    CommentAnalysisOutput,
+    CustomContext,
     MarkdownEditRequest,
 )
 
+# Test cases are independent LLM calls, so run up to this many at once.
+MAX_CONCURRENT_TEST_CASES = 8
+
 
 async def main() -> None:
     console = Console()
@@ -22,13 +27,19 @@ async def main() -> None:
         aoai_api_version="2025-01-01-preview",
     )
 
-    for i, custom_context in enumerate(custom_contexts):
-        markdown_edit_request = MarkdownEditRequest(
-            context=custom_context,
-            request_type="dev",
-            chat_completion_client=client,
-        )
-        output = await run_comment_analysis(markdown_edit_request)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TEST_CASES)
+
+    async def run_test_case(custom_context: CustomContext) -> CommentAnalysisOutput:
+        async with semaphore:
+            markdown_edit_request = MarkdownEditRequest(
+                context=custom_context,
+                request_type="dev",
+                chat_completion_client=client,
+            )
+            return await run_comment_analysis(markdown_edit_request)
+
+    outputs = await asyncio.gather(*(run_test_case(custom_context) for custom_context in custom_contexts))
+    for output in outputs:
         console.print(output)
 
 
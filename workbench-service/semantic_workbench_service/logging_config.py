@@ -1,6 +1,6 @@
 import logging
 import re
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Awaitable, Callable
 
 import asgi_correlation_id
@@ -32,12 +32,18 @@ class DebugLevelForNoisyLogFilter(logging.Filter):
 
     def __init__(self, log_level: int, *names_and_patterns: tuple[str, re.Pattern]):
         self._log_level = log_level
-        self._names_and_patterns = names_and_patterns
+        # index the patterns by logger name, so records from other loggers are passed through with a single lookup
+        self._patterns_by_name: dict[str, tuple[re.Pattern, ...]] = {}
+        for name, pattern in names_and_patterns:
+            self._patterns_by_name[name] = (*self._patterns_by_name.get(name, ()), pattern)
 
     def filter(self, record: logging.LogRecord) -> bool:
-        if not any(
-            record.name == name and pattern.search(record.getMessage()) for name, pattern in self._names_and_patterns
-        ):
+        patterns = self._patterns_by_name.get(record.name)
+        if not patterns:
+            return True
+
+        message = record.getMessage()
+        if not any(pattern.search(message) for pattern in patterns):
             return True
 
         record.levelname = logging.getLevelName(logging.DEBUG)
@@ -81,13 +87,17 @@ def log_request_middleware(
         E.g. log:
         0.0.0.0:1234 - "GET /ping HTTP/1.1" 200 OK 1.00ms 0b
         """
+        # skip the timing and formatting entirely when the access log would be discarded
+        if not access_logger.isEnabledFor(logging.INFO):
+            return await call_next(request)
+
         url = f"{request.url.path}?{request.query_params}" if request.query_params else request.url.path
-        start_time = perf_counter()
+        start_ns = perf_counter_ns()
         response = await call_next(request)
-        process_time = (perf_counter() - start_time) * 1000
-        formatted_process_time = "{0:.2f}".format(process_time)
-        host = getattr(getattr(request, "client", None), "host", None)
-        port = getattr(getattr(request, "client", None), "port", None)
+        formatted_process_time = f"{(perf_counter_ns() - start_ns) / 1_000_000:.2f}"
+        client = request.client
+        host = client.host if client else None
+        port = client.port if client else None
         http_version = f"HTTP/{request.scope.get('http_version', '1.1')}"
         content_length = response.headers.get("content-length", 0)
         access_logger.info(
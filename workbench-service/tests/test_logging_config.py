@@ -0,0 +1,59 @@
+import logging
+import re
+
+import pytest
+from semantic_workbench_service.logging_config import DebugLevelForNoisyLogFilter
+
+
+def make_record(name: str, message: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord(name, logging.INFO, __file__, 1, message, args, None)
+
+
+@pytest.fixture
+def noisy_filter() -> DebugLevelForNoisyLogFilter:
+    return DebugLevelForNoisyLogFilter(
+        logging.INFO,
+        ("access", re.compile(r"GET /")),
+        ("access", re.compile(r"/ping")),
+        ("other", re.compile(r"noisy")),
+    )
+
+
+def test_filter_passes_through_other_loggers(noisy_filter: DebugLevelForNoisyLogFilter) -> None:
+    record = make_record("unrelated", "GET /ping")
+
+    assert noisy_filter.filter(record)
+    assert record.levelno == logging.INFO
+
+
+def test_filter_passes_through_unmatched_messages(noisy_filter: DebugLevelForNoisyLogFilter) -> None:
+    record = make_record("access", "POST /conversations")
+
+    assert noisy_filter.filter(record)
+    assert record.levelno == logging.INFO
+
+
+@pytest.mark.parametrize("message", ["GET /conversations", "HEAD /ping"])
+def test_filter_lowers_any_matching_pattern_for_the_logger(
+    noisy_filter: DebugLevelForNoisyLogFilter, message: str
+) -> None:
+    record = make_record("access", message)
+
+    assert not noisy_filter.filter(record)
+    assert record.levelno == logging.DEBUG
+    assert record.levelname == "DEBUG"
+
+
+def test_filter_matches_the_formatted_message(noisy_filter: DebugLevelForNoisyLogFilter) -> None:
+    record = make_record("other", "%s request", "noisy")
+
+    assert not noisy_filter.filter(record)
+    assert record.levelno == logging.DEBUG
+
+
+def test_filter_keeps_lowered_records_at_debug_level() -> None:
+    debug_filter = DebugLevelForNoisyLogFilter(logging.DEBUG, ("access", re.compile(r"/ping")))
+    record = make_record("access", "GET /ping")
+
+    assert debug_filter.filter(record)
+    assert record.levelno == logging.DEBUG